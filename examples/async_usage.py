@@ -0,0 +1,300 @@
+"""Laneful Async Client Examples
+=============================
+
+Async usage examples for the Laneful Python client.
+
+Run with: python examples/async_usage.py
+
+Requires: pip install laneful[async]
+"""
+
+import asyncio
+import base64
+import binascii
+import os
+import random
+import sys
+import time
+from typing import Any, Awaitable, Coroutine, Dict, List, Union
+
+from laneful import Address, AsyncLanefulClient, Attachment, Email, LanefulClient
+from laneful.exceptions import LanefulError
+
+BASE_URL = "https://custom-endpoint.send.laneful.net"
+AUTH_TOKEN = "your-auth-token"
+
+# Cap on in-flight requests for bulk sends. Keep this at or below the
+# aiohttp connector pool size so tasks queue on the semaphore instead of
+# piling up waiting for a free connection.
+DEFAULT_CONCURRENCY_LIMIT = 20
+
+
+async def _gather_limited(
+    coros: List[Coroutine[Any, Any, Any]], limit: int = DEFAULT_CONCURRENCY_LIMIT
+) -> List[Any]:
+    """
+    Run coroutines concurrently with at most `limit` in flight.
+
+    Unbounded asyncio.gather over thousands of sends exhausts the
+    connector pool and triggers rate-limit errors; a semaphore keeps
+    concurrency maximal without overshooting.
+    """
+    sem = asyncio.Semaphore(limit)
+
+    async def _run(coro: Awaitable[Any]) -> Any:
+        async with sem:
+            return await coro
+
+    return await asyncio.gather(*(_run(c) for c in coros), return_exceptions=True)
+
+
+# Chunk size for streaming base64 encodes: a multiple of 3 so each chunk
+# encodes independently with no padding at chunk boundaries.
+_B64_CHUNK_SIZE = 48 * 1024
+
+
+def _b64_attach(source: Union[bytes, bytearray, str]) -> str:
+    """
+    Base64-encode attachment content without intermediate copies.
+
+    Bytes are encoded in a single pass; a file path is streamed in
+    48KiB chunks so large attachments never need the raw content, the
+    encoded bytes, and the final string resident at once.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        return binascii.b2a_base64(source, newline=False).decode("ascii")
+
+    # The chunk count is known from the file size, so preallocate the
+    # parts list instead of growing it append-by-append.
+    size = os.path.getsize(source)
+    parts = [""] * ((size + _B64_CHUNK_SIZE - 1) // _B64_CHUNK_SIZE)
+    with open(source, "rb") as f:
+        for i in range(len(parts)):
+            parts[i] = base64.b64encode(f.read(_B64_CHUNK_SIZE)).decode("ascii")
+    return "".join(parts)
+
+
+# Statuses after which polling can stop.
+_TERMINAL_STATUSES = {"delivered", "bounced", "failed", "rejected"}
+
+
+async def _poll_status(
+    client: AsyncLanefulClient,
+    message_id: str,
+    *,
+    initial: float = 0.05,
+    factor: float = 2.0,
+    cap: float = 2.0,
+    max_attempts: int = 8,
+) -> Dict[str, Any]:
+    """
+    Poll an email's status with exponential backoff and jitter.
+
+    A fixed one-second sleep either wastes time (status was ready
+    sooner) or under-polls (status not ready yet); backing off from
+    50ms keeps the median check fast while bounding tail latency.
+    """
+    status: Dict[str, Any] = {}
+    for attempt in range(max_attempts):
+        try:
+            status = await client.get_email_status(message_id)
+            if status.get("status") in _TERMINAL_STATUSES:
+                return status
+        except LanefulError:
+            pass  # Transient failure; retry after the backoff sleep.
+        delay = min(cap, initial * factor**attempt)
+        await asyncio.sleep(delay + random.uniform(0, 0.01))
+    return status
+
+
+async def basic_async_email_example(client: AsyncLanefulClient) -> None:
+    """Send a single email asynchronously."""
+    email = Email(
+        from_address=Address(email="sender@example.com", name="Your Name"),
+        to=[Address(email="recipient@example.com", name="Recipient Name")],
+        subject="Hello from Laneful (Async)",
+        text_content="This is an async test email.",
+        html_content="<h1>This is an async test email.</h1>",
+    )
+
+    response = await client.send_email(email)
+    print(f"Email sent successfully: {response.status}")
+
+
+async def bulk_async_email_example(client: AsyncLanefulClient) -> None:
+    """Send a batch of emails concurrently with bounded concurrency."""
+    # One shared sender for every email: the address never changes, so
+    # there is no reason to build a fresh Address per iteration.
+    sender = Address(email="sender@example.com")
+    emails = [
+        Email(
+            from_address=sender,
+            to=[Address(email=f"user{i}@example.com")],
+            subject=f"Hello User {i}",
+            text_content=f"This is email number {i}.",
+        )
+        for i in range(10)
+    ]
+
+    # Build coroutine objects (not tasks) and let _gather_limited cap
+    # how many run at once.
+    email_tasks = [client.send_email(email) for email in emails]
+    responses = await _gather_limited(email_tasks, limit=DEFAULT_CONCURRENCY_LIMIT)
+
+    for i, response in enumerate(responses):
+        if isinstance(response, Exception):
+            print(f"Email {i + 1} failed: {response}")
+        else:
+            print(f"Email {i + 1} status: {response.status}")
+
+
+async def concurrent_email_sending(client: AsyncLanefulClient) -> None:
+    """Send several distinct emails at the same time."""
+    sender = Address(email="sender@example.com")
+    emails = [
+        Email(
+            from_address=sender,
+            to=[Address(email=f"recipient{i}@example.com")],
+            subject=f"Concurrent Email {i}",
+            text_content=f"This is concurrent email number {i}.",
+        )
+        for i in range(5)
+    ]
+
+    if sys.version_info >= (3, 11):
+        # TaskGroup cancels the remaining sends as soon as one fails
+        # (e.g. a 401 that would doom the whole batch) and has less
+        # future plumbing per task than gather.
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(client.send_email(email)) for email in emails]
+        responses = [task.result() for task in tasks]
+        print(f"Sent {len(responses)} emails concurrently!")
+    else:
+        email_tasks = [client.send_email(email) for email in emails]
+        responses = await _gather_limited(email_tasks, limit=DEFAULT_CONCURRENCY_LIMIT)
+        successes = sum(1 for r in responses if not isinstance(r, Exception))
+        print(f"Sent {successes}/{len(responses)} emails concurrently!")
+
+
+async def async_email_with_template(client: AsyncLanefulClient) -> None:
+    """Send a template email asynchronously."""
+    email = Email(
+        from_address=Address(email="sender@example.com"),
+        to=[Address(email="user@example.com")],
+        subject="Welcome!",
+        template_id="11",
+        template_data={
+            "name": "John Doe",
+            "company": "Acme Corp",
+        },
+    )
+
+    response = await client.send_email(email)
+    print(f"Template email sent: {response.status}")
+
+
+async def async_email_with_attachment(client: AsyncLanefulClient) -> None:
+    """Send an email with an attachment asynchronously."""
+    file_content = "This is the attachment content."
+    encoded_content = _b64_attach(file_content.encode())
+
+    email = Email(
+        from_address=Address(email="sender@example.com"),
+        to=[Address(email="user@example.com")],
+        subject="Document Attached",
+        text_content="Please find the document attached.",
+        attachments=[
+            Attachment(
+                file_name="document.txt",
+                content=encoded_content,
+                content_type="text/plain",
+            )
+        ],
+    )
+
+    response = await client.send_email(email)
+    print(f"Email with attachment sent: {response.status}")
+
+
+async def async_email_with_status_check(client: AsyncLanefulClient) -> None:
+    """Send an email and poll for its delivery status."""
+    email = Email(
+        from_address=Address(email="sender@example.com"),
+        to=[Address(email="user@example.com")],
+        subject="Status Check Email",
+        text_content="Checking delivery status of this email.",
+    )
+
+    response = await client.send_email(email)
+    print(f"Email sent: {response.status}")
+
+    if response.message_id:
+        status = await _poll_status(client, response.message_id)
+        print(f"Email status: {status}")
+
+
+async def async_scheduled_email(client: AsyncLanefulClient) -> None:
+    """Schedule an email to be sent later."""
+    send_time = int(time.time()) + 3600
+
+    email = Email(
+        from_address=Address(email="sender@example.com"),
+        to=[Address(email="user@example.com")],
+        subject="Scheduled Email",
+        text_content="This email was scheduled.",
+        send_time=send_time,
+    )
+
+    response = await client.send_email(email)
+    print(f"Scheduled email queued: {response.status}")
+
+
+def mixed_sync_async_example() -> None:
+    """Use the sync client alongside the async one."""
+    client = LanefulClient(base_url=BASE_URL, auth_token=AUTH_TOKEN)
+    try:
+        email = Email(
+            from_address=Address(email="sender@example.com"),
+            to=[Address(email="user@example.com")],
+            subject="Sync Email",
+            text_content="Sent with the synchronous client.",
+        )
+
+        response = client.send_email(email)
+        print(f"Sync email sent: {response.status}")
+    finally:
+        client.close()
+
+
+async def main() -> None:
+    """Run all async examples."""
+    # The banner lives in the module docstring: one co_consts string
+    # instead of a run of print literals compiled into main().
+    print(__doc__)
+
+    examples = [
+        ("Basic async email", basic_async_email_example),
+        ("Bulk async email", bulk_async_email_example),
+        ("Concurrent sending", concurrent_email_sending),
+        ("Template email", async_email_with_template),
+        ("Email with attachment", async_email_with_attachment),
+        ("Email with status check", async_email_with_status_check),
+        ("Scheduled email", async_scheduled_email),
+    ]
+
+    # One client (and one connection pool) for every example: reusing the
+    # keep-alive pool avoids a fresh TCP/TLS handshake per example.
+    async with AsyncLanefulClient(base_url=BASE_URL, auth_token=AUTH_TOKEN) as client:
+        for name, example in examples:
+            print(f"\n--- {name} ---")
+            try:
+                await example(client)
+            except Exception as e:
+                print(f"Example failed: {e}")
+
+    print("\n--- Mixed sync/async ---")
+    mixed_sync_async_example()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,136 @@
+"""Laneful Webhook Examples
+========================
+
+Webhook handling examples for the Laneful Python client.
+
+Run with: python examples/webhook_usage.py
+"""
+
+import atexit
+import hashlib
+import hmac
+import json
+import logging
+import logging.handlers
+import queue
+from collections import Counter
+
+from laneful.webhooks import WebhookEvent, WebhookHandler
+
+WEBHOOK_SECRET = "your-webhook-secret"
+
+# Event handlers log through a queue drained by one background thread:
+# a callback pays only a Queue.put instead of taking the stdout lock
+# and flushing per event, so logging never stalls webhook dispatch.
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+# Stop the listener at interpreter exit so records still queued (the
+# daemon thread would otherwise drop them) are flushed first.
+atexit.register(_log_listener.stop)
+
+log = logging.getLogger("laneful.webhook.examples")
+log.setLevel(logging.INFO)
+log.addHandler(logging.handlers.QueueHandler(_log_queue))
+
+SAMPLE_PAYLOAD = {
+    "event_type": "email.delivered",
+    "message_id": "msg_123",
+    "email": "user@example.com",
+    "timestamp": 1640995200,
+    "data": {"user_agent": "Mozilla/5.0"},
+}
+
+
+def basic_webhook_example() -> None:
+    """Register handlers and process a webhook payload."""
+    handler = WebhookHandler(webhook_secret=WEBHOOK_SECRET)
+
+    @handler.on("email.delivered")
+    def handle_delivered(event: WebhookEvent) -> None:
+        log.info("Email %s delivered to %s", event.message_id, event.email)
+
+    @handler.on("email.opened")
+    def handle_opened(event: WebhookEvent) -> None:
+        user_agent = event.data.get("user_agent", "Unknown")
+        log.info(
+            "Email %s opened by %s (%s)", event.message_id, event.email, user_agent
+        )
+
+    @handler.on("email.clicked")
+    def handle_clicked(event: WebhookEvent) -> None:
+        log.info("Link clicked: %s", event.data.get("url"))
+
+    handler.process_webhook(SAMPLE_PAYLOAD)
+
+
+def signature_verification_example() -> None:
+    """Verify a webhook signature before processing the payload."""
+    handler = WebhookHandler(webhook_secret=WEBHOOK_SECRET)
+
+    # What a sender would transmit: the request body plus an HMAC-SHA256
+    # signature of those exact bytes. In a real receiver, take the raw
+    # body (flask.request.get_data() / await request.body()) and verify
+    # it as-is — never re-serialize parsed JSON, which costs a second
+    # JSON pass and breaks on key-order or whitespace differences.
+    raw_body = json.dumps(SAMPLE_PAYLOAD, separators=(",", ":")).encode("utf-8")
+    signature = (
+        "sha256="
+        + hmac.new(WEBHOOK_SECRET.encode("utf-8"), raw_body, hashlib.sha256).hexdigest()
+    )
+
+    if handler.verify_signature(raw_body, signature):
+        print("Signature valid, processing webhook")
+        handler.process_webhook(raw_body)
+    else:
+        print("Invalid signature, rejecting webhook")
+
+
+def manual_webhook_processing() -> None:
+    """Track per-event-type statistics across a stream of events."""
+    handler = WebhookHandler()
+    email_stats: Counter = Counter()
+
+    # One handler registered for every tracked event type: a single
+    # Counter update per event, with stats reported once per batch.
+    @handler.on(
+        (
+            "email.sent",
+            "email.delivered",
+            "email.opened",
+            "email.clicked",
+            "email.bounced",
+        )
+    )
+    def track(event: WebhookEvent) -> None:
+        email_stats[event.event_type.rsplit(".", 1)[-1]] += 1
+
+    events = [
+        {"event_type": "email.sent", "message_id": f"msg_{i}"} for i in range(3)
+    ] + [
+        {"event_type": "email.delivered", "message_id": "msg_0"},
+        {"event_type": "email.opened", "message_id": "msg_0"},
+    ]
+
+    for payload in events:
+        handler.process_webhook(payload)
+
+    log.info("Processed %d events: %s", len(events), dict(email_stats))
+
+
+def main() -> None:
+    """Run all webhook examples."""
+    # Banner comes from the module docstring rather than print literals.
+    print(__doc__)
+
+    for name, example in [
+        ("Basic webhook handling", basic_webhook_example),
+        ("Signature verification", signature_verification_example),
+        ("Manual webhook processing", manual_webhook_processing),
+    ]:
+        print(f"\n--- {name} ---")
+        example()
+
+
+if __name__ == "__main__":
+    main()
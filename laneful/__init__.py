@@ -9,30 +9,46 @@ Installation:
 - Full support: pip install laneful[all]
 """
 
-from typing import List, Optional, Type
+import importlib
+import importlib.util
+from typing import TYPE_CHECKING, Any, List, Tuple
 
 from .exceptions import LanefulAPIError, LanefulAuthError, LanefulError
 from .models import Address, Attachment, Email, EmailResponse, TrackingSettings
 
-# Always available (sync client)
-LanefulClient: Optional[Type] = None
-try:
-    from .client import LanefulClient  # noqa
+if TYPE_CHECKING:
+    # Redundant-alias form marks these as intentional re-exports for
+    # type checkers and linters; at runtime they resolve lazily below.
+    from .async_client import AsyncLanefulClient as AsyncLanefulClient
+    from .client import LanefulClient as LanefulClient
 
-    _has_sync = True
-except ImportError:
-    _has_sync = False
+__version__ = "1.0.0"
 
-# Conditionally available (async client)
-AsyncLanefulClient: Optional[Type] = None
-try:
-    from .async_client import AsyncLanefulClient  # noqa
+# Probe for the optional HTTP stacks without importing them; the client
+# classes below are loaded lazily on first attribute access so that
+# `import laneful` stays cheap for users who only need the models or
+# webhook handling.
+_has_sync = importlib.util.find_spec("requests") is not None
+_has_async = importlib.util.find_spec("aiohttp") is not None
 
-    _has_async = True
-except ImportError:
-    _has_async = False
+# Lazily-imported attributes: name -> (module, attribute)
+_LAZY = {
+    "LanefulClient": ("laneful.client", "LanefulClient"),
+    "AsyncLanefulClient": ("laneful.async_client", "AsyncLanefulClient"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Load client classes on first access (PEP 562)."""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name)
+    value = getattr(module, attr)
+    globals()[name] = value  # Cache so later lookups skip __getattr__.
+    return value
 
-__version__ = "1.0.0"
 
 # Build __all__ dynamically based on available imports
 __all__ = [
@@ -54,26 +70,38 @@ if _has_sync:
 if _has_async:
     __all__.append("AsyncLanefulClient")
 
+# Availability is fixed at import time, so expose it as constants; hot
+# paths that check capabilities per message can read these directly.
+HAS_SYNC: bool = _has_sync
+HAS_ASYNC: bool = _has_async
+AVAILABLE_CLIENTS: Tuple[str, ...] = tuple(
+    name for name, ok in (("sync", _has_sync), ("async", _has_async)) if ok
+)
+
 
 # Convenience functions to check what's available
 def has_sync_support() -> bool:
     """Check if synchronous client support is available."""
-    return _has_sync
+    return HAS_SYNC
 
 
 def has_async_support() -> bool:
     """Check if asynchronous client support is available."""
-    return _has_async
+    return HAS_ASYNC
 
 
 def get_available_clients() -> List[str]:
     """Get a list of available client types."""
-    clients = []
-    if _has_sync:
-        clients.append("sync")
-    if _has_async:
-        clients.append("async")
-    return clients
-
-
-__all__.extend(["has_sync_support", "has_async_support", "get_available_clients"])
+    return list(AVAILABLE_CLIENTS)
+
+
+__all__.extend(
+    [
+        "HAS_SYNC",
+        "HAS_ASYNC",
+        "AVAILABLE_CLIENTS",
+        "has_sync_support",
+        "has_async_support",
+        "get_available_clients",
+    ]
+)
@@ -20,6 +20,39 @@ from .base import BaseLanefulClient
 from .exceptions import LanefulError
 from .models import Email, EmailList, EmailResponse, EmailResponseList
 
+# Process-wide connector shared by clients that don't bring their own,
+# so short-lived clients reuse one DNS-cached, keep-alive TCP pool
+# instead of paying a TLS handshake per instance. Rebuilt if the event
+# loop changes (connectors are bound to the loop they were created on).
+_shared_connector: Optional[aiohttp.TCPConnector] = None
+_shared_connector_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _default_connector() -> aiohttp.TCPConnector:
+    """Build a connector tuned for many small keep-alive HTTPS requests."""
+    return aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=32,
+        ttl_dns_cache=300,
+        keepalive_timeout=75,
+        enable_cleanup_closed=True,
+    )
+
+
+def _get_shared_connector() -> aiohttp.TCPConnector:
+    """Get the shared connector, creating it for the running loop if needed."""
+    global _shared_connector, _shared_connector_loop
+
+    loop = asyncio.get_event_loop()
+    if (
+        _shared_connector is None
+        or _shared_connector.closed
+        or _shared_connector_loop is not loop
+    ):
+        _shared_connector = _default_connector()
+        _shared_connector_loop = loop
+    return _shared_connector
+
 
 class AsyncLanefulClient(BaseLanefulClient):
     """
@@ -45,6 +78,7 @@ class AsyncLanefulClient(BaseLanefulClient):
         auth_token: str,
         timeout: float = 30.0,
         verify_ssl: bool = True,
+        connector: Optional[aiohttp.TCPConnector] = None,
     ) -> None:
         """
         Initialize the asynchronous Laneful client.
@@ -54,6 +88,10 @@ class AsyncLanefulClient(BaseLanefulClient):
             auth_token: Your authentication token
             timeout: Request timeout in seconds (default: 30.0)
             verify_ssl: Whether to verify SSL certificates (default: True)
+            connector: Optional aiohttp connector to use. When omitted,
+                clients with verify_ssl=True share a process-wide
+                connector; close() never closes a shared or caller-owned
+                connector, only the session.
         """
         super().__init__(base_url, auth_token, timeout, verify_ssl)
 
@@ -63,14 +101,25 @@ class AsyncLanefulClient(BaseLanefulClient):
         # Configure SSL context
         self.ssl_context = True if verify_ssl else False
 
+        self._connector = connector
         self._session: Optional[aiohttp.ClientSession] = None
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create the aiohttp session."""
         if self._session is None or self._session.closed:
-            connector = aiohttp.TCPConnector(ssl=self.ssl_context)
+            if self._connector is not None and not self._connector.closed:
+                connector, owner = self._connector, False
+            elif self.verify_ssl:
+                connector, owner = _get_shared_connector(), False
+            else:
+                # Disabled SSL verification is per-client; keep it out of
+                # the shared pool.
+                connector, owner = aiohttp.TCPConnector(ssl=False), True
             self._session = aiohttp.ClientSession(
-                headers=self.headers, timeout=self.aiohttp_timeout, connector=connector
+                headers=self.headers,
+                timeout=self.aiohttp_timeout,
+                connector=connector,
+                connector_owner=owner,
             )
         return self._session
 
@@ -97,10 +146,13 @@ class AsyncLanefulClient(BaseLanefulClient):
         session = await self._get_session()
 
         try:
+            # Payloads are pre-encoded to bytes (Content-Type is already
+            # application/json in the session headers), so aiohttp does
+            # no JSON work of its own.
             async with session.request(
                 method=method,
                 url=url,
-                json=data,
+                data=self._encode_payload(data) if data is not None else None,
             ) as response:
                 # Get response text
                 response_text = await response.text()
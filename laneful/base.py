@@ -4,12 +4,29 @@ Base client functionality shared between sync and async clients.
 
 import json
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 from urllib.parse import urljoin
 
 from .exceptions import LanefulAPIError, LanefulAuthError
 from .models import Email, EmailList, EmailResponse, EmailResponseList
 
+try:
+    # Optional C-accelerated JSON encoders (pip install laneful[fast]);
+    # request bodies are encoded once here and sent as raw bytes.
+    from msgspec.json import encode as _encode_json_impl
+except ImportError:
+    try:
+        from orjson import dumps as _encode_json_impl
+    except ImportError:
+
+        def _encode_json_impl(obj: Any) -> bytes:
+            return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+# All three encoders return JSON bytes; the explicit annotation keeps
+# _encode_payload typed as bytes whichever one is picked.
+_encode_json: Callable[[Any], bytes] = _encode_json_impl
+
 
 class BaseLanefulClient(ABC):
     """
@@ -49,6 +66,10 @@ class BaseLanefulClient(ABC):
         """Build the full URL for an API endpoint."""
         return urljoin(self.base_url + "/v1/", endpoint.lstrip("/"))
 
+    def _encode_payload(self, data: Dict[str, Any]) -> bytes:
+        """Encode a request payload to JSON bytes ready to send."""
+        return _encode_json(data)
+
     def _process_response_data(
         self, response_data: Dict[str, Any], status_code: int
     ) -> Dict[str, Any]:
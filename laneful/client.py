@@ -81,10 +81,13 @@ class LanefulClient(BaseLanefulClient):
         url = self._build_url(endpoint)
 
         try:
+            # Payloads are pre-encoded to bytes (Content-Type is already
+            # application/json in the session headers), so the HTTP layer
+            # does no JSON work of its own.
             response = self.session.request(
                 method=method,
                 url=url,
-                json=data,
+                data=self._encode_payload(data) if data is not None else None,
                 timeout=self.timeout,
                 verify=self.verify_ssl,
                 headers=self.headers,
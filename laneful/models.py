@@ -2,6 +2,7 @@
 Data models for the Laneful API.
 """
 
+import binascii
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
@@ -37,6 +38,22 @@ class Attachment:
                 "Either file_name or inline_id is required for attachments"
             )
 
+    @classmethod
+    def from_bytes(
+        cls, file_name: str, content: bytes, content_type: str
+    ) -> "Attachment":
+        """
+        Create an attachment from raw bytes, base64-encoding the content.
+
+        Uses binascii.b2a_base64 directly so bulk attachment building
+        skips the extra wrapper call and newline strip in base64.b64encode.
+        """
+        return cls(
+            content_type=content_type,
+            file_name=file_name,
+            content=binascii.b2a_base64(content, newline=False).decode("ascii"),
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API requests."""
         result = {"content_type": self.content_type}
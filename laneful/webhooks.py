@@ -2,17 +2,424 @@
 Webhook handling for Laneful API events.
 """
 
-import hmac
-import hashlib
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from enum import Enum
+from types import ModuleType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+# hashlib drags in the OpenSSL bindings and json its C scanner; clients
+# that only send email import this module's names without ever handling
+# a webhook, so both load on first real use rather than at import time
+# (the same reason laneful/__init__ resolves its clients lazily). The
+# Optional[ModuleType] globals are None until _load_runtime_deps runs;
+# attribute access on a module is untyped, which is the usual cost of
+# deferring stdlib imports.
+hashlib: Optional[ModuleType] = None
+hmac: Optional[ModuleType] = None
+json: Optional[ModuleType] = None
+_loads: Optional[Callable[[Any], Any]] = None
+
+
+def _load_runtime_deps() -> None:
+    """Import the hashing and JSON machinery on first use."""
+    global hashlib, hmac, json, _loads
+    import hashlib as _hashlib
+    import hmac as _hmac
+    import json as _json
+
+    hashlib, hmac, json = _hashlib, _hmac, _json
+    try:
+        # Optional C-accelerated JSON parser (pip install laneful[fast]);
+        # stdlib json keeps the default install dependency-free.
+        from orjson import loads as _loads_impl
+    except ImportError:
+        _loads = _json.loads
+    else:
+        _loads = _loads_impl
+
+
+# Event types as plain module-level constants: hot-path comparisons
+# load a str directly instead of walking the Enum descriptor protocol.
+EMAIL_SENT: Final[str] = "email.sent"
+EMAIL_DELIVERED: Final[str] = "email.delivered"
+EMAIL_OPENED: Final[str] = "email.opened"
+EMAIL_CLICKED: Final[str] = "email.clicked"
+EMAIL_BOUNCED: Final[str] = "email.bounced"
+EMAIL_DROPPED: Final[str] = "email.dropped"
+EMAIL_COMPLAINED: Final[str] = "email.complained"
+EMAIL_UNSUBSCRIBED: Final[str] = "email.unsubscribed"
+
+
+class WebhookEventType(str, Enum):
+    """
+    Known Laneful webhook event types.
+
+    Inherits str (StrEnum needs 3.11), so members compare equal to the
+    raw event-type strings without going through .value.
+    """
+
+    EMAIL_SENT = EMAIL_SENT
+    EMAIL_DELIVERED = EMAIL_DELIVERED
+    EMAIL_OPENED = EMAIL_OPENED
+    EMAIL_CLICKED = EMAIL_CLICKED
+    EMAIL_BOUNCED = EMAIL_BOUNCED
+    EMAIL_DROPPED = EMAIL_DROPPED
+    EMAIL_COMPLAINED = EMAIL_COMPLAINED
+    EMAIL_UNSUBSCRIBED = EMAIL_UNSUBSCRIBED
+
+
+# Shared read-only default for events without a "data" payload, so a
+# miss does not allocate a fresh dict per event. Handlers treat event
+# payloads as immutable (the dataclass is frozen), so sharing is safe.
+_EMPTY_DATA: Final[Dict[str, Any]] = {}
+
+
+@dataclass(frozen=True)
+class WebhookEvent:
+    """
+    A single webhook event delivered by the Laneful API.
+
+    Events are immutable: the payload is parsed into attributes once in
+    from_dict and every registered handler sees the same instance.
+    """
+
+    # Declared by hand rather than dataclass(slots=True), which needs
+    # Python 3.10; works here because no field has a class-level default.
+    __slots__ = ("event_type", "message_id", "email", "timestamp", "data")
+
+    event_type: str
+    message_id: str
+    email: str
+    timestamp: int
+    data: Dict[str, Any]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WebhookEvent":
+        """Create from a parsed webhook payload."""
+        # Positional construction: the generated __init__ binds five
+        # arguments straight into slots without keyword matching, and
+        # each field is one dict.get away from the parsed payload.
+        return cls(
+            # Interning maps the freshly-parsed string onto the interned
+            # key used by the handler registry, so dict lookups and ==
+            # checks short-circuit on identity. The vocabulary is small
+            # and bounded (see WebhookEventType), so the table stays tiny.
+            sys.intern(data.get("event_type", "")),
+            data.get("message_id", ""),
+            data.get("email", ""),
+            data.get("timestamp", 0),
+            data.get("data") or _EMPTY_DATA,
+        )
+
+
+WebhookEventHandler = Callable[[WebhookEvent], None]
+
+# Raw payloads may arrive as any bytes-like buffer; memoryview lets
+# callers pass a slice of a larger receive buffer without copying.
+WebhookPayload = Union[str, bytes, bytearray, memoryview]
+
+# Bounds for the per-handler expected-digest cache used during retry
+# storms (providers re-deliver identical payloads on failure).
+_DIGEST_CACHE_SIZE = 1024
+_DIGEST_CACHE_TTL = 300.0  # seconds
+
+
+class WebhookHandler:
+    """
+    Dispatches incoming Laneful webhook events to registered handlers.
+
+    Example:
+        handler = WebhookHandler(webhook_secret="your-webhook-secret")
+
+        @handler.on("email.delivered")
+        def handle_delivered(event: WebhookEvent):
+            print(f"Email {event.message_id} delivered to {event.email}")
+
+        handler.process_webhook(webhook_payload)
+    """
+
+    def __init__(
+        self,
+        webhook_secret: Optional[str] = None,
+        require_signature: bool = False,
+    ) -> None:
+        """
+        Initialize the webhook handler.
+
+        Args:
+            webhook_secret: Secret used to verify webhook signatures.
+                If None, signature verification is skipped.
+            require_signature: If True, refuse to construct a handler
+                without a webhook_secret. Misconfiguration then fails
+                once at startup instead of silently accepting every
+                payload (and the per-call fast path stays a single
+                is-None check).
+
+        Raises:
+            ValueError: If require_signature is True and no secret given
+        """
+        if require_signature and webhook_secret is None:
+            raise ValueError("require_signature=True requires a webhook_secret")
+        if hmac is None:
+            _load_runtime_deps()
+        self.webhook_secret = webhook_secret
+        # Encode the secret once; verify_signature runs per request.
+        self._secret_bytes = (
+            webhook_secret.encode("utf-8") if webhook_secret is not None else None
+        )
+        # Keyed by event type so dispatch is one dict lookup rather than
+        # a scan over every registered handler. The bound .get is cached
+        # so the per-event dispatch is a single LOAD_FAST + call instead
+        # of an attribute and method lookup; it stays valid across
+        # registrations because the dict object itself never changes.
+        self._handlers: Dict[str, List[WebhookEventHandler]] = defaultdict(list)
+        # Seed every known event type so lookups for unhandled-but-known
+        # types hit an (empty) entry and take the same path as handled
+        # ones, with all keys interned.
+        for known_type in WebhookEventType:
+            self._handlers[sys.intern(known_type.value)]
+        self._handlers_get = self._handlers.get
+        # Expected digests keyed by payload fingerprint: retried
+        # deliveries of the same payload skip the HMAC recompute. Hits
+        # still run compare_digest, so cached lookups keep the timing
+        # profile of the uncached path.
+        self._digest_cache: Dict[bytes, Tuple[bytes, float]] = {}
+
+    def on(
+        self, event_type: Union[str, Iterable[str]]
+    ) -> Callable[[WebhookEventHandler], WebhookEventHandler]:
+        """
+        Decorator that registers a handler for one or more event types.
+
+        Args:
+            event_type: An event type, e.g. "email.delivered", or an
+                iterable of event types to register the same handler for
+        """
+        event_types = (
+            (event_type,) if isinstance(event_type, str) else tuple(event_type)
+        )
+
+        def decorator(func: WebhookEventHandler) -> WebhookEventHandler:
+            for single_type in event_types:
+                self.register_handler(single_type, func)
+            return func
+
+        return decorator
+
+    def register_handler(self, event_type: str, handler: WebhookEventHandler) -> None:
+        """Register a handler function for an event type."""
+        self._handlers[sys.intern(event_type)].append(handler)
+
+    def verify_signature(
+        self, payload: WebhookPayload, signature: Optional[str]
+    ) -> bool:
+        """
+        Verify the signature of a webhook payload.
+
+        Args:
+            payload: The raw webhook payload (str or any bytes-like
+                buffer, including a memoryview over a receive buffer)
+            signature: The signature header value, optionally prefixed
+                with "sha256="
+
+        Returns:
+            True if the signature is valid (or no secret is configured)
+        """
+        if self._secret_bytes is None:
+            return True
+        if not signature:
+            return False
+        # A configured secret means __init__ ran _load_runtime_deps.
+        assert hashlib is not None and hmac is not None
+
+        signature = signature.removeprefix("sha256=")
+
+        if isinstance(payload, str):
+            # surrogatepass round-trips lone surrogates that can appear
+            # in strings decoded from arbitrary JSON, so str and raw
+            # bytes of the same wire payload verify identically.
+            payload = payload.encode("utf-8", "surrogatepass")
+        # bytes/bytearray/memoryview go straight into the C hash calls
+        # below with no copy.
+
+        # The cache key is a BLAKE2b fingerprint of the payload — faster
+        # than SHA-256 and fine for cache addressing; the digest only
+        # depends on payload and secret, so the signature is not part of
+        # the key.
+        cache_key = hashlib.blake2b(payload, digest_size=16).digest()
+        now = time.monotonic()
+        cached = self._digest_cache.get(cache_key)
+        if cached is not None and now - cached[1] < _DIGEST_CACHE_TTL:
+            expected = cached[0]
+        else:
+            # One-shot C path straight into OpenSSL's HMAC, which
+            # dispatches to the hardware-accelerated SHA-256 where
+            # available. This is a single C call end to end — a native
+            # extension wrapping HMAC/EVP directly would save nothing
+            # beyond it.
+            expected = hmac.digest(self._secret_bytes, payload, "sha256")
+            if len(self._digest_cache) >= _DIGEST_CACHE_SIZE:
+                # Evict the oldest insertion (dicts preserve order).
+                del self._digest_cache[next(iter(self._digest_cache))]
+            self._digest_cache[cache_key] = (expected, now)
+
+        # Normalize the provided signature to a fixed 32-byte buffer and
+        # always run the comparison: malformed or wrong-length guesses
+        # take the same path as near-misses instead of returning early
+        # and leaking the length class. Bitwise & (not short-circuit
+        # `and`) keeps both operands evaluated.
+        try:
+            provided = bytes.fromhex(signature)
+        except ValueError:
+            provided = b""
+        well_formed = len(provided) == len(expected)
+        padded = provided.ljust(len(expected), b"\x00")[: len(expected)]
+        return bool(hmac.compare_digest(expected, padded) & well_formed)
+
+    def verify_signatures(
+        self, items: Iterable[Tuple[WebhookPayload, Optional[str]]]
+    ) -> List[bool]:
+        """
+        Verify a batch of (payload, signature) pairs.
+
+        Convenience for burst ingestion such as provider re-delivery:
+        one call verifies the whole batch, with the method lookup paid
+        once. Each pair goes through the same constant-time path as
+        verify_signature.
+
+        Args:
+            items: Pairs of raw payload and signature header value
+
+        Returns:
+            One bool per pair, in input order
+        """
+        verify = self.verify_signature
+        return [verify(payload, signature) for payload, signature in items]
+
+    def process_webhook(
+        self, payload: Union[WebhookPayload, Dict[str, Any]]
+    ) -> WebhookEvent:
+        """
+        Parse a webhook payload and dispatch it to registered handlers.
+
+        Args:
+            payload: The webhook payload as raw JSON (str or any
+                bytes-like buffer, including memoryview) or a parsed
+                dict
+
+        Returns:
+            The parsed WebhookEvent
+        """
+        # json.loads (and orjson.loads) consume bytes directly; callers
+        # holding a raw body never need to decode to str first. Both
+        # were loaded when this handler was constructed.
+        assert json is not None and _loads is not None
+        if isinstance(payload, memoryview):
+            # orjson parses a memoryview zero-copy; the stdlib parser
+            # rejects it, so materialize bytes only on that fallback.
+            data = _loads(payload if _loads is not json.loads else payload.tobytes())
+        elif isinstance(payload, (str, bytes, bytearray)):
+            data = _loads(payload)
+        else:
+            data = payload
+        event = WebhookEvent.from_dict(data)
+        self.handle_event(event)
+        return event
+
+    def handle_event(self, event: WebhookEvent) -> None:
+        """Dispatch an already-parsed event to registered handlers."""
+        handlers = self._handlers_get(event.event_type)
+        if handlers is not None:
+            for handler in handlers:
+                handler(event)
+
+
+def create_flask_webhook_handler(handler: WebhookHandler) -> Callable[[], Any]:
+    """
+    Build a Flask view function that verifies and dispatches webhooks.
+
+    The view verifies the signature over the raw request body — the
+    exact bytes the sender signed — rather than re-serializing parsed
+    JSON, which would both double the JSON work and break on key-order
+    or whitespace differences.
+
+    Example:
+        app.add_url_rule(
+            "/webhook", view_func=create_flask_webhook_handler(handler),
+            methods=["POST"],
+        )
+    """
+
+    def flask_webhook_view() -> Any:
+        from flask import request
+
+        body = request.get_data(cache=True)
+        signature = request.headers.get("X-Laneful-Signature")
+        if not handler.verify_signature(body, signature):
+            return {"error": "invalid signature"}, 401
+        handler.process_webhook(body)
+        return {"status": "ok"}, 200
+
+    return flask_webhook_view
+
+
+def create_fastapi_webhook_handler(
+    handler: WebhookHandler,
+) -> Callable[..., Any]:
+    """
+    Build a FastAPI endpoint function that verifies and dispatches webhooks.
+
+    Like the Flask view, the handler works on the raw request body the
+    sender actually signed; it is verified and parsed exactly once.
+
+    Example:
+        fastapi_handler = create_fastapi_webhook_handler(handler)
+
+        @app.post("/webhook")
+        async def webhook(request: Request):
+            return await fastapi_handler(
+                await request.body(),
+                request.headers.get("X-Laneful-Signature"),
+            )
+    """
+
+    async def fastapi_webhook_handler(
+        raw_body: bytes, signature: Optional[str] = None
+    ) -> Dict[str, str]:
+        if not handler.verify_signature(raw_body, signature):
+            raise ValueError("Invalid webhook signature")
+        handler.process_webhook(raw_body)
+        return {"status": "ok"}
+
+    return fastapi_webhook_handler
 
 
 def verify_webhook_signature(secret: str, payload: str, signature: str) -> bool:
     """Verify the signature of a webhook payload"""
-    # Create HMAC with SHA256
-    mac = hmac.new(secret.encode("utf-8"), payload.encode("utf-8"), hashlib.sha256)
+    if hmac is None:
+        _load_runtime_deps()
+    assert hmac is not None
+    # Decode the provided hex signature once and compare 32 raw bytes
+    # instead of hex-encoding the expected digest into a 64-char string.
+    try:
+        provided = bytes.fromhex(signature.removeprefix("sha256="))
+    except ValueError:
+        return False
 
-    # Get the expected signature as hex string
-    expected = mac.hexdigest()
+    expected = hmac.digest(secret.encode("utf-8"), payload.encode("utf-8"), "sha256")
 
     # Compare signatures using constant-time comparison
-    return hmac.compare_digest(signature, expected)
+    return bool(hmac.compare_digest(expected, provided))
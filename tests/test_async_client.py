@@ -257,6 +257,41 @@ class TestAsyncLanefulClient:
         self.client.__del__()
 
 
+@pytest.mark.asyncio
+async def test_clients_share_default_connector():
+    """Test that clients without an explicit connector share one pool."""
+    client_a = AsyncLanefulClient("https://test.laneful.net", "token-a")
+    client_b = AsyncLanefulClient("https://test.laneful.net", "token-b")
+
+    session_a = await client_a._get_session()
+    session_b = await client_b._get_session()
+
+    connector = session_a.connector
+    assert connector is session_b.connector
+
+    await client_a.close()
+    await client_b.close()
+
+    # Closing a client must not close the shared connector
+    assert not connector.closed
+
+
+@pytest.mark.asyncio
+async def test_explicit_connector_is_used():
+    """Test that a caller-supplied connector is respected."""
+    connector = aiohttp.TCPConnector()
+    client = AsyncLanefulClient(
+        "https://test.laneful.net", "token", connector=connector
+    )
+
+    session = await client._get_session()
+    assert session.connector is connector
+
+    await client.close()
+    assert not connector.closed
+    await connector.close()
+
+
 @pytest.mark.asyncio
 async def test_multiple_concurrent_requests():
     """Test that multiple concurrent requests work properly."""
@@ -62,7 +62,10 @@ class TestLanefulClient:
         call_args = mock_request.call_args
         assert call_args[1]["method"] == "POST"
         assert "/email" in call_args[1]["url"]
-        assert call_args[1]["json"] == {'emails': [self.sample_email.to_dict()]}
+        # Payloads are sent pre-encoded as JSON bytes
+        assert json.loads(call_args[1]["data"]) == {
+            'emails': [self.sample_email.to_dict()]
+        }
     
     @patch('requests.Session.request')
     def test_send_emails_success(self, mock_request):
@@ -61,6 +61,14 @@ class TestAttachment:
         }
         assert att.to_dict() == expected
     
+    def test_attachment_from_bytes(self):
+        """Test creating attachment from raw bytes."""
+        att = Attachment.from_bytes("test.txt", b"test content", "text/plain")
+
+        assert att.file_name == "test.txt"
+        assert att.content == "dGVzdCBjb250ZW50"
+        assert att.content_type == "text/plain"
+
     def test_attachment_validation_failure(self):
         """Test attachment validation fails without file_name or inline_id."""
         with pytest.raises(ValueError) as exc_info:
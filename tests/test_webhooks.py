@@ -0,0 +1,293 @@
+"""Tests for webhook handling."""
+
+import hashlib
+import hmac
+import json
+
+import pytest
+
+from laneful.webhooks import (
+    EMAIL_BOUNCED,
+    EMAIL_DELIVERED,
+    WebhookEvent,
+    WebhookEventType,
+    WebhookHandler,
+    create_fastapi_webhook_handler,
+    verify_webhook_signature,
+)
+
+
+def _sign(secret: str, payload: str) -> str:
+    """Compute the hex HMAC-SHA256 signature a sender would attach."""
+    return hmac.new(
+        secret.encode("utf-8"), payload.encode("utf-8"), hashlib.sha256
+    ).hexdigest()
+
+
+class TestWebhookEvent:
+    """Test cases for WebhookEvent."""
+
+    def test_from_dict(self):
+        """Test creating an event from a payload dict."""
+        event = WebhookEvent.from_dict({
+            "event_type": "email.delivered",
+            "message_id": "msg_123",
+            "email": "user@test.com",
+            "timestamp": 1640995200,
+            "data": {"user_agent": "test-agent"},
+        })
+
+        assert event.event_type == "email.delivered"
+        assert event.message_id == "msg_123"
+        assert event.email == "user@test.com"
+        assert event.timestamp == 1640995200
+        assert event.data["user_agent"] == "test-agent"
+
+    def test_from_dict_defaults(self):
+        """Test that missing payload fields fall back to defaults."""
+        event = WebhookEvent.from_dict({})
+
+        assert event.event_type == ""
+        assert event.message_id == ""
+        assert event.data == {}
+
+    def test_from_dict_null_data(self):
+        """Test that an explicit null data field falls back to empty."""
+        event = WebhookEvent.from_dict({"event_type": "email.sent", "data": None})
+
+        assert event.data == {}
+
+
+class TestWebhookHandler:
+    """Test cases for WebhookHandler."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.handler = WebhookHandler(webhook_secret="test-secret")
+
+    def test_verify_signature_valid(self):
+        """Test that a valid signature verifies."""
+        payload = '{"event_type": "email.delivered"}'
+        signature = _sign("test-secret", payload)
+
+        assert self.handler.verify_signature(payload, signature) is True
+
+    def test_verify_signature_with_prefix(self):
+        """Test that the sha256= prefix is accepted."""
+        payload = '{"event_type": "email.delivered"}'
+        signature = "sha256=" + _sign("test-secret", payload)
+
+        assert self.handler.verify_signature(payload, signature) is True
+
+    def test_verify_signature_invalid(self):
+        """Test that a wrong signature is rejected."""
+        payload = '{"event_type": "email.delivered"}'
+        signature = _sign("wrong-secret", payload)
+
+        assert self.handler.verify_signature(payload, signature) is False
+
+    def test_verify_signature_missing(self):
+        """Test that an empty signature is rejected."""
+        assert self.handler.verify_signature("payload", None) is False
+        assert self.handler.verify_signature("payload", "") is False
+
+    def test_verify_signature_bytes_payload(self):
+        """Test verification against a raw bytes payload."""
+        payload = b'{"event_type": "email.delivered"}'
+        signature = hmac.new(
+            b"test-secret", payload, hashlib.sha256
+        ).hexdigest()
+
+        assert self.handler.verify_signature(payload, signature) is True
+
+    def test_verify_signature_memoryview_payload(self):
+        """Test verification against a memoryview slice of a buffer."""
+        buffer = b'junk{"event_type": "email.sent"}junk'
+        payload = memoryview(buffer)[4:-4]
+        signature = hmac.new(
+            b"test-secret", bytes(payload), hashlib.sha256
+        ).hexdigest()
+
+        assert self.handler.verify_signature(payload, signature) is True
+
+    def test_verify_signature_malformed_hex(self):
+        """Test that a non-hex signature is rejected rather than raising."""
+        assert self.handler.verify_signature("payload", "not-hex!") is False
+
+    def test_verify_signatures_batch(self):
+        """Test batch verification of several payload/signature pairs."""
+        good = '{"event_type": "email.sent"}'
+        bad = '{"event_type": "email.bounced"}'
+
+        results = self.handler.verify_signatures(
+            [
+                (good, _sign("test-secret", good)),
+                (bad, _sign("wrong-secret", bad)),
+            ]
+        )
+
+        assert results == [True, False]
+
+    def test_verify_signature_no_secret(self):
+        """Test that verification is skipped without a secret."""
+        handler = WebhookHandler()
+        assert handler.verify_signature("anything", "bogus") is True
+
+    def test_verify_signature_repeated_delivery(self):
+        """Test that re-delivered payloads verify consistently via the cache."""
+        payload = '{"event_type": "email.sent", "message_id": "msg_r"}'
+        good = _sign("test-secret", payload)
+
+        assert self.handler.verify_signature(payload, good) is True
+        # Second delivery hits the digest cache; a bad signature for the
+        # same payload must still fail.
+        assert self.handler.verify_signature(payload, good) is True
+        assert self.handler.verify_signature(payload, "0" * 64) is False
+
+    def test_require_signature_without_secret(self):
+        """Test that require_signature refuses a secret-less handler."""
+        with pytest.raises(ValueError) as exc_info:
+            WebhookHandler(require_signature=True)
+        assert "webhook_secret" in str(exc_info.value)
+
+    def test_require_signature_with_secret(self):
+        """Test that require_signature accepts a configured secret."""
+        handler = WebhookHandler(webhook_secret="s", require_signature=True)
+        assert handler.webhook_secret == "s"
+
+    def test_on_decorator_dispatch(self):
+        """Test that decorated handlers receive matching events."""
+        received = []
+
+        @self.handler.on("email.delivered")
+        def handle_delivered(event):
+            received.append(event)
+
+        event = self.handler.process_webhook({
+            "event_type": "email.delivered",
+            "message_id": "msg_123",
+        })
+
+        assert received == [event]
+        assert received[0].message_id == "msg_123"
+
+    def test_on_decorator_multiple_event_types(self):
+        """Test registering one handler for several event types at once."""
+        seen = []
+
+        @self.handler.on(("email.sent", "email.delivered"))
+        def track(event):
+            seen.append(event.event_type)
+
+        self.handler.process_webhook({"event_type": "email.sent"})
+        self.handler.process_webhook({"event_type": "email.delivered"})
+        self.handler.process_webhook({"event_type": "email.opened"})
+
+        assert seen == ["email.sent", "email.delivered"]
+
+    def test_dispatch_only_matching_handlers(self):
+        """Test that non-matching handlers are not called."""
+        calls = []
+
+        self.handler.register_handler("email.opened", lambda e: calls.append("opened"))
+        self.handler.register_handler(
+            "email.delivered", lambda e: calls.append("delivered")
+        )
+
+        self.handler.process_webhook({"event_type": "email.delivered"})
+
+        assert calls == ["delivered"]
+
+    def test_process_webhook_json_string(self):
+        """Test processing a JSON string payload."""
+        payload = json.dumps({"event_type": "email.opened", "email": "u@test.com"})
+
+        event = self.handler.process_webhook(payload)
+
+        assert event.event_type == "email.opened"
+        assert event.email == "u@test.com"
+
+    def test_process_webhook_raw_bytes(self):
+        """Test processing a raw bytes payload as received off the wire."""
+        payload = b'{"event_type": "email.delivered", "message_id": "msg_9"}'
+
+        event = self.handler.process_webhook(payload)
+
+        assert event.event_type == "email.delivered"
+        assert event.message_id == "msg_9"
+
+    def test_process_webhook_memoryview(self):
+        """Test processing a memoryview payload without copying to str."""
+        payload = memoryview(b'{"event_type": "email.sent", "message_id": "m1"}')
+
+        event = self.handler.process_webhook(payload)
+
+        assert event.event_type == "email.sent"
+        assert event.message_id == "m1"
+
+    def test_process_webhook_bytearray(self):
+        """Test processing a bytearray payload without decoding."""
+        payload = bytearray(b'{"event_type": "email.opened"}')
+
+        event = self.handler.process_webhook(payload)
+
+        assert event.event_type == "email.opened"
+
+    def test_event_types_enum(self):
+        """Test that known event types are defined."""
+        assert WebhookEventType.EMAIL_DELIVERED.value == "email.delivered"
+        assert WebhookEventType.EMAIL_BOUNCED.value == "email.bounced"
+
+    def test_event_type_constants(self):
+        """Test that the module-level constants compare as plain strings."""
+        assert EMAIL_DELIVERED == "email.delivered"
+        assert EMAIL_BOUNCED == "email.bounced"
+        # The enum inherits str, so members compare without .value too.
+        assert WebhookEventType.EMAIL_DELIVERED == EMAIL_DELIVERED
+
+
+class TestFrameworkHandlers:
+    """Test cases for the framework integration factories."""
+
+    @pytest.mark.asyncio
+    async def test_fastapi_handler_raw_body(self):
+        """Test that the FastAPI handler verifies and parses raw bytes."""
+        handler = WebhookHandler(webhook_secret="test-secret")
+        seen = []
+        handler.register_handler("email.delivered", lambda e: seen.append(e))
+
+        raw_body = b'{"event_type": "email.delivered", "message_id": "msg_1"}'
+        signature = hmac.new(b"test-secret", raw_body, hashlib.sha256).hexdigest()
+
+        fastapi_handler = create_fastapi_webhook_handler(handler)
+        result = await fastapi_handler(raw_body, signature)
+
+        assert result == {"status": "ok"}
+        assert seen[0].message_id == "msg_1"
+
+    @pytest.mark.asyncio
+    async def test_fastapi_handler_invalid_signature(self):
+        """Test that a bad signature is rejected before processing."""
+        handler = WebhookHandler(webhook_secret="test-secret")
+        fastapi_handler = create_fastapi_webhook_handler(handler)
+
+        with pytest.raises(ValueError):
+            await fastapi_handler(b'{"event_type": "email.sent"}', "0" * 64)
+
+
+class TestVerifyWebhookSignature:
+    """Test cases for the module-level verify function."""
+
+    def test_valid_signature(self):
+        """Test that a valid signature verifies."""
+        payload = '{"event": "test"}'
+        signature = _sign("secret", payload)
+
+        assert verify_webhook_signature("secret", payload, signature) is True
+
+    def test_invalid_signature(self):
+        """Test that a tampered signature is rejected."""
+        payload = '{"event": "test"}'
+        signature = _sign("secret", payload)
+
+        assert verify_webhook_signature("other", payload, signature) is False